@@ -1,4 +1,4 @@
-from typing import Iterator
+_STATUS = ('Borrowed', 'Available')
 
 
 class Book:
@@ -11,6 +11,7 @@ class Book:
     >>> b.is_available
     True
     """
+    __slots__ = ('_title', '_author', '_str_cache', 'book_id', 'is_available')
 
     def __init__(self, title: str, author: str, book_id: int | None = None, is_available: bool = True) -> None:
         """
@@ -22,11 +23,20 @@ class Book:
         >>> b.is_available
         True
         """
-        self.title = title
-        self.author = author
+        self._title = title
+        self._author = author
+        self._str_cache = f'{title} by {author}'
         self.book_id = book_id
         self.is_available = is_available
 
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def author(self) -> str:
+        return self._author
+
     def mark_as_borrowed(self):
         """
         Marks the book as borrowed if it's not available.
@@ -72,7 +82,7 @@ class Book:
         >>> str(b)
         'Animal Farm by George Orwell'
         """
-        return f'{self.title} by {self.author}'
+        return self._str_cache
 
 
 class Member:
@@ -83,8 +93,13 @@ class Member:
     >>> m.name
     'Alice'
     >>> m.borrowed_books
-    []
+    {}
+    >>> m.name = "Alicja"
+    Traceback (most recent call last):
+    ...
+    AttributeError: property 'name' of 'Member' object has no setter
     """
+    __slots__ = ('_name', 'member_id', 'borrowed_books')
 
     def __init__(self, name: str, member_id: int | None = None) -> None:
         """
@@ -94,11 +109,15 @@ class Member:
         >>> m.member_id
         1
         >>> m.borrowed_books
-        []
+        {}
         """
-        self.name = name
+        self._name = name
         self.member_id = member_id
-        self.borrowed_books: list[Book] = []
+        self.borrowed_books: dict[int, Book] = {}
+
+    @property
+    def name(self) -> str:
+        return self._name
 
     def borrow_book(self, book: Book) -> None:
         """
@@ -115,12 +134,17 @@ class Member:
         Traceback (most recent call last):
         ...
         ValueError: Book is not available.
+        >>> m.borrow_book(Book("Animal Farm", "George Orwell"))  # Books without an ID are kept apart
+        >>> len(m.borrowed_books)
+        2
+        >>> m.return_book(b)
+        >>> b.is_available
+        True
         """
-        if isinstance(book, Book) and book.is_available:
-            book.mark_as_borrowed()
-            self.borrowed_books.append(book)
-        else:
+        if not book.is_available:
             raise ValueError('Book is not available.')
+        book.mark_as_borrowed()
+        self.borrowed_books[id(book)] = book
 
     def return_book(self, book: Book) -> None:
         """
@@ -137,11 +161,10 @@ class Member:
         ...
         ValueError: This book is not marked as borrowed.
         """
-        if isinstance(book, Book) and not book.is_available:
-            book.mark_as_returned()
-            self.borrowed_books.remove(book)
-        else:
+        if self.borrowed_books.get(id(book)) is not book:
             raise ValueError('This book is not marked as borrowed.')
+        book.mark_as_returned()
+        del self.borrowed_books[id(book)]
 
     def set_id(self, new_id: int) -> None:
         """
@@ -155,8 +178,12 @@ class Member:
         Traceback (most recent call last):
         ...
         ValueError: Member has id.
+        >>> Member("Dana", 0).set_id(7)
+        Traceback (most recent call last):
+        ...
+        ValueError: Member has id.
         """
-        if self.member_id:
+        if self.member_id is not None:
             raise ValueError('Member has id.')
         else:
             self.member_id = new_id
@@ -191,6 +218,28 @@ class Library:
         self.members: list[Member] = []
         self.id_counter_book = 0
         self.id_counter_member = 0
+        self._books_by_id: dict[int, Book] = {}
+        self._members_by_id: dict[int, Member] = {}
+        self._title_index: dict[str, list[int]] = {}
+        self._name_index: dict[str, list[int]] = {}
+
+    @staticmethod
+    def _remove_from_index(index: dict[str, list[int]], key: str, item_id: int) -> None:
+        """
+        Removes an ID from a title/name index, dropping the key once it has no IDs left.
+
+        >>> index = {'1984': [0, 1]}
+        >>> Library._remove_from_index(index, '1984', 0)
+        >>> index
+        {'1984': [1]}
+        >>> Library._remove_from_index(index, '1984', 1)
+        >>> index
+        {}
+        """
+        ids = index[key]
+        ids.remove(item_id)
+        if not ids:
+            del index[key]
 
     def get_book_by_id(self, book_id: int) -> Book:
         """
@@ -206,10 +255,9 @@ class Library:
         ...
         ValueError: Book not found.
         """
-        find_book = list(filter(lambda book: book.book_id == book_id, self.books))
-        if find_book:
-            return find_book[0]
-        else:
+        try:
+            return self._books_by_id[book_id]
+        except KeyError:
             raise ValueError('Book not found.')
 
     def get_member_by_id(self, member_id: int) -> Member:
@@ -226,10 +274,9 @@ class Library:
         ...
         ValueError: Member not found.
         """
-        find_member = list(filter(lambda member: member.member_id == member_id, self.members))
-        if find_member:
-            return find_member[0]
-        else:
+        try:
+            return self._members_by_id[member_id]
+        except KeyError:
             raise ValueError('Member not found.')
 
     def add_book(self, title: str, author: str) -> None:
@@ -244,6 +291,8 @@ class Library:
         book_id = self.id_counter_book
         new_book = Book(title, author, book_id)
         self.books.append(new_book)
+        self._books_by_id[book_id] = new_book
+        self._title_index.setdefault(title, []).append(book_id)
         self.id_counter_book += 1
 
     def remove_book(self, book_id: int) -> None:
@@ -265,6 +314,8 @@ class Library:
         """
         book_to_remove: Book = self.get_book_by_id(book_id)
         if book_to_remove.is_available:
+            self._remove_from_index(self._title_index, book_to_remove.title, book_id)
+            del self._books_by_id[book_id]
             self.books.remove(book_to_remove)
         else:
             raise ValueError('Cannot remove a borrowed book.')
@@ -281,6 +332,8 @@ class Library:
         member_id = self.id_counter_member
         new_member = Member(name, member_id)
         self.members.append(new_member)
+        self._members_by_id[member_id] = new_member
+        self._name_index.setdefault(name, []).append(member_id)
         self.id_counter_member += 1
 
     def deregister_member(self, member_id: int) -> None:
@@ -299,9 +352,17 @@ class Library:
         Traceback (most recent call last):
         ...
         ValueError: Cannot deregister a member who still has borrowed books.
+        >>> lib.deregister_member(0)
+        Traceback (most recent call last):
+        ...
+        ValueError: Member not found.
+        >>> lib.find_member_id("Zed")
+        []
         """
         member_to_check: Member = self.get_member_by_id(member_id)
         if len(member_to_check.borrowed_books) == 0:
+            self._remove_from_index(self._name_index, member_to_check.name, member_id)
+            del self._members_by_id[member_id]
             self.members.remove(member_to_check)
         else:
             raise ValueError('Cannot deregister a member who still has borrowed books.')
@@ -318,14 +379,18 @@ class Library:
         Traceback (most recent call last):
         ...
         ValueError: Book not found.
+        >>> lib.borrow_book(99, 0)
+        Traceback (most recent call last):
+        ...
+        ValueError: Member not found.
+        >>> lib.borrow_book(0, 0)
+        Traceback (most recent call last):
+        ...
+        ValueError: Book is not available.
         """
-        try:
-            member: Member = self.get_member_by_id(member_id)
-            book: Book = self.get_book_by_id(book_id)
-            if member and book:
-                member.borrow_book(book)
-        except ValueError:
-            raise ValueError('Book not found.')
+        member: Member = self.get_member_by_id(member_id)
+        book: Book = self.get_book_by_id(book_id)
+        member.borrow_book(book)
 
     def return_book(self, member_id: int, book_id: int) -> None:
         """
@@ -341,15 +406,11 @@ class Library:
         >>> lib.return_book(0, 0)
         Traceback (most recent call last):
         ...
-        ValueError: Member does not have this book.
+        ValueError: This book is not marked as borrowed.
         """
-        try:
-            member: Member = self.get_member_by_id(member_id)
-            book: Book = self.get_book_by_id(book_id)
-            if member and book:
-                member.return_book(book)
-        except ValueError:
-            raise ValueError('Member does not have this book.')
+        member: Member = self.get_member_by_id(member_id)
+        book: Book = self.get_book_by_id(book_id)
+        member.return_book(book)
 
     def list_available_books(self) -> list[str | None]:
         """
@@ -363,7 +424,7 @@ class Library:
         >>> lib.list_available_books()
         ['Brave New World by Aldous Huxley']
         """
-        return [str(book) for book in self.books if book.is_available]
+        return [book._str_cache for book in self.books if book.is_available]
 
     def find_member_id(self, name: str) -> list[int | None]:
         """
@@ -377,9 +438,7 @@ class Library:
         >>> lib.find_member_id("Unknown")
         []
         """
-        members_search: Iterator[Member] = filter(lambda member: member.name == name, self.members)
-        members_id: list[int | None] = list(map(lambda members: members.member_id, members_search))
-        return members_id
+        return list(self._name_index.get(name, ()))
 
     def find_book_id(self, title: str) -> list[int | None]:
         """
@@ -392,10 +451,11 @@ class Library:
         [0, 1]
         >>> lib.find_book_id("NotHere")
         []
+        >>> lib.remove_book(0)
+        >>> lib.find_book_id("1984")
+        [1]
         """
-        books_search: Iterator[Book] = filter(lambda book: book.title == title, self.books)
-        books_id: list[int | None] = list(map(lambda books: books.book_id, books_search))
-        return books_id
+        return list(self._title_index.get(title, ()))
 
     def __str__(self) -> str:
         """
@@ -424,7 +484,15 @@ class Library:
         members: 1
         - Alice [ID: 0] Borrowed books: 1
         """
-        title = self.__class__.__name__
-        books_repr = '\n'.join([f'- {str(book)} (ID: {book.book_id}) {''.join(['Available' if book.is_available else 'Borrowed'])}' for book in self.books])
-        members_repr = ''.join([f'- {str(member)}\n' for member in self.members]) or '---'
-        return f'{title}\nbooks: {len(self.books)}\n{books_repr}\nmembers: {len(self.members)}\n{members_repr}'.strip()
+        parts = [self.__class__.__name__, '\nbooks: ', str(len(self.books)), '\n']
+        for book in self.books:
+            parts += ('- ', book._str_cache, ' (ID: ', str(book.book_id), ') ', _STATUS[book.is_available], '\n')
+        if not self.books:
+            parts.append('\n')
+        parts += ('members: ', str(len(self.members)), '\n')
+        if self.members:
+            for member in self.members:
+                parts += ('- ', str(member), '\n')
+        else:
+            parts.append('---')
+        return ''.join(parts).strip()
@@ -1,6 +1,14 @@
 import json
 from enum import Enum
+from dataclasses import InitVar, dataclass, field
 from datetime import date
+from functools import lru_cache
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class Priority(Enum):
@@ -15,6 +23,37 @@ class Status(Enum):
     COMPLETED = 'Completed'
 
 
+_PRIO_ORDER = (Priority.HIGH, Priority.MEDIUM, Priority.LOW)
+_PRIO_BY_VALUE = {p.value: p for p in Priority}
+_STATUS_BY_VALUE = {s.value: s for s in Status}
+
+
+@lru_cache(maxsize=4096)
+def _validate_iso_date(value: str) -> str:
+    return str(date.fromisoformat(value))
+
+
+class _Deadline:
+    """
+    Validating descriptor for Task.deadline (a property would become the dataclass default)
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return None
+        return instance._deadline
+
+    def __set__(self, instance, value):
+        if value is not None:
+            try:
+                value = _validate_iso_date(value)
+            except ValueError:
+                raise ValueError('Incorrect date format YYYY-MM-DD')
+        instance._deadline = value
+        instance._dict['deadline'] = value
+
+
+@dataclass(slots=True, eq=False)
 class Task:
     """
     Represents a task in the task list.
@@ -27,66 +66,57 @@ class Task:
     >>> task.status.name
     'PENDING'
     >>> task.to_dict()
-    {'task_id': 0, 'title': 'Buy groceries', 'description': '', 'priority': 'High', 'status': 'Pending', 'deadline': '2025-01-20'}
+    {'task_id': None, 'title': 'Buy groceries', 'description': '', 'priority': 'High', 'status': 'Pending', 'deadline': '2025-01-20'}
     >>> print(task)
     Buy groceries - Priority: High, Status: Pending
-    >>> task2 = Task("Read book", priority=Priority.LOW)
+    >>> task.priority = Priority.LOW
+    >>> task.to_dict()['priority']
+    'Low'
+    >>> task.to_dict()['title'] = 'Changed'
+    >>> task.title
+    'Buy groceries'
+    >>> task2 = Task("Read book", task_id=1, priority=Priority.LOW)
     >>> task2.to_dict()
     {'task_id': 1, 'title': 'Read book', 'description': '', 'priority': 'Low', 'status': 'Pending', 'deadline': None}
-    >>> Task.id_counter = 0
+    >>> Task("Pay bills", deadline="20-01-2025")
+    Traceback (most recent call last):
+    ...
+    ValueError: Incorrect date format YYYY-MM-DD
+    >>> task2.deadline = "garbage"
+    Traceback (most recent call last):
+    ...
+    ValueError: Incorrect date format YYYY-MM-DD
+    >>> task2.deadline = "2025-02-01"
+    >>> task2.to_dict()['deadline']
+    '2025-02-01'
     """
-    id_counter: int = 0
-
-    def __init__(self, title, task_id=None, description: str | None = None, priority: Priority = Priority.LOW,
-                 status: Status = Status.PENDING, deadline=None):
-        self.title = title
-        self.description = description or ''
-        self.priority = priority
-        self.status = status
-        self.deadline = deadline
-        self.task_id = task_id
-
-        if task_id is None:
-            number = self.id_number()
-            self.set_id(number)
+    title: str
+    task_id: int | None = None
+    description: str | None = None
+    priority: Priority = Priority.LOW
+    status: Status = Status.PENDING
+    deadline: InitVar[str | None] = _Deadline()
+    _deadline: str | None = field(init=False, default=None)
+    _dict: dict = field(init=False, repr=False, default_factory=dict)
 
-    @classmethod
-    def id_number(cls) -> int:
-        """
-        Liczy id dla wszystkich task (licznik współdzielony między wszystkimi instancjami)
-        """
-        id_number = cls.id_counter
-        cls.id_counter += 1
-        return id_number
-
-    @classmethod
-    def update_counter(cls, new_id):
-        """
-        Update counter after load_from_file with old ids
-        """
-        cls.id_counter = new_id
-
-    @property
-    def deadline(self):
-        return self._deadline
+    def __post_init__(self, deadline):
+        self.description = self.description or ''
+        self.deadline = deadline
+        self._dict = self._build_dict()
 
-    @deadline.setter
-    def deadline(self, value):
-        if value is None:
-            self._deadline = None
-        else:
-            try:
-                parsed_date = date.fromisoformat(value)
-                self._deadline = str(parsed_date)
-            except ValueError:
-                raise ValueError('Incorrect date format YYYY-MM-DD')
+    def _build_dict(self) -> dict:
+        return {'task_id': self.task_id, 'title': self.title, 'description': self.description,
+                'priority': self.priority.value, 'status': self.status.value, 'deadline': self.deadline}
 
     def set_id(self, number):
         self.task_id = number
+        self._dict['task_id'] = number
 
     def to_dict(self):
-        return {'task_id': self.task_id, 'title': self.title, 'description': self.description,
-                'priority': self.priority.value, 'status': self.status.value, 'deadline': self.deadline}
+        """
+        Current state of the task; save_to_file writes the cached _dict kept in sync by TaskList
+        """
+        return self._build_dict()
 
     def __str__(self):
         return f'{self.title} - Priority: {self.priority.value}, Status: {self.status.value}'
@@ -134,8 +164,8 @@ class TaskList:
     - Complete assignment - Priority: High, Status: Pending
     - Buy groceries - Priority: Low, Status: Pending
     - Read book - Priority: Medium, Status: Pending
-    >>> task_list.update_task(4, status=Status.IN_PROGRESS)
-    >>> task_list.update_task(5, status=Status.COMPLETED)
+    >>> task_list.update_task(1, status=Status.IN_PROGRESS)
+    >>> task_list.update_task(2, status=Status.COMPLETED)
     >>> print(task_list)
     Task List:
     - Complete assignment - Priority: High, Status: Pending
@@ -145,67 +175,126 @@ class TaskList:
 
     def __init__(self) -> None:
         self._tasks: list[Task] = []
+        self._by_id: dict[int, Task] = {}
+        self._by_status: dict[Status, dict[int, Task]] = {s: {} for s in Status}
+        self._list_cache: str | None = None
+        self._next_id: int = 0
 
     def add_task(self, title: str, task_id: int | None = None, description: str | None = None,
                  priority: Priority = Priority.LOW,
                  status: Status = Status.PENDING, deadline: str | None = None) -> None:
+        if task_id is None:
+            task_id = self._next_id
         task = Task(title, task_id, description, priority, status, deadline)
+        self._next_id = max(self._next_id, task_id + 1)
         self._tasks.append(task)
+        self._by_id[task.task_id] = task
+        self._by_status[task.status][task.task_id] = task
+        self._list_cache = None
 
     def _find_task(self, id_number: int) -> Task:
         try:
-            task_to_find = list(filter(lambda task: task.task_id == id_number, self._tasks))[0]
-            return task_to_find
-        except IndexError:
+            return self._by_id[id_number]
+        except KeyError:
             raise ValueError('Task ID does not exist.')
 
     def remove_task(self, id_number: int) -> None:
         task_to_remove = self._find_task(id_number)
         if task_to_remove:
+            del self._by_id[id_number]
+            del self._by_status[task_to_remove.status][id_number]
             self._tasks.remove(task_to_remove)
+            self._list_cache = None
 
     def update_task(self, id_number: int, status: Status | None = None, priority: Priority | None = None):
         task_to_update: Task = self._find_task(id_number)
         if status:
+            del self._by_status[task_to_update.status][id_number]
+            self._by_status[status][id_number] = task_to_update
             task_to_update.status = status
+            task_to_update._dict['status'] = status.value
         elif priority:
             task_to_update.priority = priority
+            task_to_update._dict['priority'] = priority.value
         else:
             raise ValueError('You must provide status or priority to make an update')
+        self._list_cache = None
 
     def list_tasks(self, status: Status = None, sort: Priority | str | None = None) -> str:
         """
         filter by status, sort by (priority or deadline)
+
+        >>> task_list = TaskList()
+        >>> task_list.add_task("Read book", priority=Priority.LOW, deadline="2025-03-01")
+        >>> task_list.add_task("Pay bills", priority=Priority.HIGH)
+        >>> task_list.add_task("Call mom", priority=Priority.MEDIUM, deadline="2025-02-01")
+        >>> print(task_list.list_tasks(sort=Priority.HIGH))
+        - Pay bills - Priority: High, Status: Pending
+        - Call mom - Priority: Medium, Status: Pending
+        - Read book - Priority: Low, Status: Pending
+        >>> print(task_list.list_tasks(sort='deadline'))
+        - Call mom - Priority: Medium, Status: Pending
+        - Read book - Priority: Low, Status: Pending
+        - Pay bills - Priority: High, Status: Pending
         """
         if status:
-            tasks = list(filter(lambda obj: obj.status == status, self._tasks))
+            tasks = self._by_status[status].values()
         elif isinstance(sort, Priority):
-            tasks = sorted(self._tasks, key=lambda obj: obj.priority == sort)
+            buckets: dict[Priority, list[Task]] = {priority: [] for priority in _PRIO_ORDER}
+            for task in self._tasks:
+                buckets[task.priority].append(task)
+            tasks = [task for bucket in buckets.values() for task in bucket]
         elif sort:
-            tasks = sorted(self._tasks, key=lambda obj: obj.deadline == sort)
+            tasks = sorted([task for task in self._tasks if task.deadline is not None], key=attrgetter('_deadline'))
+            tasks += [task for task in self._tasks if task.deadline is None]
         else:
-            tasks = self._tasks
+            if self._list_cache is None:
+                self._list_cache = '\n'.join([f'- {str(task)}' for task in self._tasks])
+            return self._list_cache
         tasks_view = '\n'.join([f'- {str(task)}' for task in tasks])
         return tasks_view
 
     def save_to_file(self, file_name: str) -> None:
         with open(file_name, 'w', encoding="utf-8") as file:
-            json.dump([task.to_dict() for task in self._tasks],
+            json.dump([task._dict for task in self._tasks],
                       file,
                       indent=4)
 
     def load_from_file(self, file_name: str) -> None:
         self._tasks = []
+        self._by_id = {}
+        self._by_status = {s: {} for s in Status}
+        self._list_cache = None
+        self._next_id = 0
         try:
-            with open(file_name, 'r') as file:
-                content = json.load(file)
+            with open(file_name, 'rb') as file:
+                raw = file.read()
+            content = orjson.loads(raw) if orjson is not None else json.loads(raw)
             for obj in content:
-                obj['priority'] = Priority(obj['priority'])
-                obj['status'] = Status(obj['status'])
-                self.add_task(**obj)
-            Task.update_counter(max(task.task_id for task in self._tasks) + 1)
+                obj['priority'] = _PRIO_BY_VALUE[obj['priority']]
+                obj['status'] = _STATUS_BY_VALUE[obj['status']]
+            self._bulk_load(content)
         except (FileNotFoundError, json.JSONDecodeError):
-            Task.update_counter(0)
+            pass
+
+    def _bulk_load(self, rows: list[dict]) -> None:
+        """
+        Add tasks saved by save_to_file without re-validating them
+        """
+        for row in rows:
+            task = Task.__new__(Task)
+            task.title = row['title']
+            task.description = row['description'] or ''
+            task.priority = row['priority']
+            task.status = row['status']
+            task._deadline = row['deadline']
+            task.task_id = row['task_id']
+            task._dict = task._build_dict()
+            self._tasks.append(task)
+            self._by_id[task.task_id] = task
+            self._by_status[task.status][task.task_id] = task
+            self._next_id = max(self._next_id, task.task_id + 1)
+        self._list_cache = None
 
     def __str__(self) -> str:
         title = 'Task List:\n'
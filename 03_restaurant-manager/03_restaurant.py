@@ -1,9 +1,17 @@
-import os.path
+import csv
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
+from itertools import count
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_HISTORY_HEADER = ('Order ID', 'Table ID', 'Menu Item Id', 'Status', 'Price', 'Timestamp')
+
 
 class TableStatus(Enum):
     EMPTY = 'empty'
@@ -36,13 +44,16 @@ class Table:
     0
     >>> Table.reset_id_counter()
     """
-    _id_counter = 1
+    __slots__ = ('seats_number', 'status', '_guests', 'table_id', '_id_repr')
+    _id_gen = count(1)
+    _STATUS_FMT = {TableStatus.TAKEN: '----- ', TableStatus.RESERVED: '--R-- '}
 
     def __init__(self, seats_number: int, status: TableStatus = TableStatus.EMPTY, guests: int = 0) -> None:
         self.seats_number = seats_number
         self.status = status
         self.guests = guests
         self.table_id = self.get_id()
+        self._id_repr = f'#{self.table_id:02d} '
 
     @property
     def guests(self):
@@ -63,25 +74,18 @@ class Table:
 
     @classmethod
     def get_id(cls) -> int:
-        id_number = cls._id_counter
-        cls._id_counter += 1
-        return id_number
+        return next(cls._id_gen)
 
     @classmethod
     def reset_id_counter(cls) -> None:
-        cls._id_counter = 1
+        cls._id_gen = count(1)
 
     def change_table_status(self, new_status: TableStatus) -> None:
         self.status = new_status
 
     def __str__(self) -> str:
-        if self.status == TableStatus.EMPTY:
-            status_repr = f'{self.guests:>2}/{self.seats_number}  '
-        elif self.status == TableStatus.TAKEN:
-            status_repr = '----- '
-        else:
-            status_repr = '--R-- '
-        return f'#{self.table_id:02d} {status_repr}'
+        status_repr = self._STATUS_FMT.get(self.status) or f'{self._guests:>2}/{self.seats_number}  '
+        return self._id_repr + status_repr
 
 
 class Dish:
@@ -92,11 +96,23 @@ class Dish:
     >>> dish.update_dish_params(price=35.5, gluten_free=True)
     >>> dish.to_dict()
     {'name': 'Spaghetti Bolognese', 'price': 35.5, 'gluten_free': True, 'vegan': False, 'vegetarian': False, 'spice_level': 0}
+    >>> dish.update_dish_params(price=20.0, spice_level=9)
+    Traceback (most recent call last):
+    ...
+    ValueError: Spice level needs to be 0, 1, 2 or 3!
+    >>> dish.price
+    35.5
+    >>> dish.update_dish_params(name="Lasagne")
+    Traceback (most recent call last):
+    ...
+    ValueError: Dish name can be changed only through MenuItem.update_dish_params
     """
+    __slots__ = ('_name', 'price', 'gluten_free', 'vegan', 'vegetarian', '_spice_level', 'id_number', 'status')
+    _VALID_SPICE = frozenset({0, 1, 2, 3})
 
     def __init__(self, name: str, price: float, gluten_free=False, vegan=False,
                  vegetarian=False, spice_level=0, id_number: int | None = None):
-        self.name = name.title()
+        self._name = name.title()
         self.price = price
         self.gluten_free = gluten_free
         self.vegan = vegan
@@ -105,13 +121,17 @@ class Dish:
         self.id_number = id_number
         self.status: OrderStatus = OrderStatus.TO_BE_PREPARED
 
+    @property
+    def name(self) -> str:
+        return self._name
+
     @property
     def spice_level(self):
         return self._spice_level
 
     @spice_level.setter
     def spice_level(self, value: int):
-        if value not in [0, 1, 2, 3]:
+        if value not in self._VALID_SPICE:
             raise ValueError('Spice level needs to be 0, 1, 2 or 3!')
         else:
             self._spice_level = value
@@ -120,6 +140,11 @@ class Dish:
         """
         Update the dish parameters if it has such attributes
         """
+        if kwargs.get('name') is not None:
+            raise ValueError('Dish name can be changed only through MenuItem.update_dish_params')
+        spice_level = kwargs.get('spice_level')
+        if spice_level is not None and spice_level not in self._VALID_SPICE:
+            raise ValueError('Spice level needs to be 0, 1, 2 or 3!')
         for k, v in kwargs.items():
             if hasattr(self, k) and v is not None:
                 setattr(self, k, v)
@@ -176,36 +201,64 @@ class MenuItem:
 
     def __init__(self):
         self.dishes = []
+        self._by_name: dict[str, Dish] = {}
         self.id_counter = 1
 
     def add_dish(self, name: str, price: float, gluten_free=False, vegan=False, vegetarian=False, spice_level=0):
-        if any(dish.name == name for dish in self.dishes):
+        if name.title() in self._by_name:
             raise ValueError('Dish already exist in menu, please use update_dish_params')
         else:
             dish_id = self.id_counter
             dish: Dish = Dish(name=name, price=price, gluten_free=gluten_free, vegan=vegan,
                               vegetarian=vegetarian, spice_level=spice_level, id_number=dish_id)
             self.dishes.append(dish)
+            self._by_name[dish.name] = dish
             self.id_counter += 1
 
     def find_dish(self, dish_name: str) -> Dish:
         try:
-            return [dish for dish in self.dishes if dish.name == dish_name][0]
-        except IndexError:
+            return self._by_name[dish_name]
+        except KeyError:
             raise ValueError('Dish with that name does not exist.')
 
     def remove_dish(self, dish_name: str) -> None:
         dish_to_rem = self.find_dish(dish_name)
-        if dish_to_rem:
-            self.dishes.remove(dish_to_rem)
+        del self._by_name[dish_to_rem.name]
+        self.dishes.remove(dish_to_rem)
 
     def update_dish_params(self, dish_name: str, **kwargs) -> None:
         """
         Update dish parameters if exist and has that attribute.
+
+        >>> menu = MenuItem()
+        >>> menu.add_dish(name="Pizza", price=20.0)
+        >>> menu.add_dish(name="Soup", price=10.0)
+        >>> menu.update_dish_params('Pizza', name='soup')
+        Traceback (most recent call last):
+        ...
+        ValueError: Dish already exist in menu, please use update_dish_params
+        >>> menu.update_dish_params('Pizza', name='pizza margherita')
+        >>> menu.find_dish('Pizza Margherita').price
+        20.0
+        >>> menu.update_dish_params('Pizza Margherita', name='calzone', spice_level=9)
+        Traceback (most recent call last):
+        ...
+        ValueError: Spice level needs to be 0, 1, 2 or 3!
+        >>> menu.remove_dish('Pizza Margherita')
+        >>> print(menu)
+        - Soup
         """
         update_dish: Dish = self.find_dish(dish_name)
-        if update_dish:
-            update_dish.update_dish_params(**kwargs)
+        new_name = kwargs.pop('name', None)
+        if new_name is not None:
+            new_name = new_name.title()
+            if new_name != dish_name and new_name in self._by_name:
+                raise ValueError('Dish already exist in menu, please use update_dish_params')
+        update_dish.update_dish_params(**kwargs)
+        if new_name is not None and new_name != dish_name:
+            update_dish._name = new_name
+            del self._by_name[dish_name]
+            self._by_name[new_name] = update_dish
 
     def save_to_file(self, file_name: str) -> None:
         """
@@ -220,17 +273,20 @@ class MenuItem:
         Load menu from input files.
         """
         self.dishes = []
+        self._by_name = {}
         self.id_counter = 1
         try:
-            with open(file_name, 'r') as file:
-                menu = json.load(file)
-            [self.add_dish(**dish) for dish in menu]
+            with open(file_name, 'rb') as file:
+                raw = file.read()
+            menu = orjson.loads(raw) if orjson is not None else json.loads(raw)
+            for dish in menu:
+                self.add_dish(**dish)
         except (FileNotFoundError, json.JSONDecodeError):
             raise RuntimeError('Error during running file.')
         return self
 
     def __str__(self) -> str:
-        return ''.join([f'- {dish.name}\n' for dish in self.dishes]).strip()
+        return '\n'.join([f'- {dish.name}' for dish in self.dishes])
 
 
 class Order:
@@ -275,67 +331,73 @@ class Order:
     >>> Order.reset_id_counter()
     >>> Table.reset_id_counter()
     """
-    _menu: MenuItem = MenuItem().load_from_file()
-    _id_counter = 1
+    __slots__ = ('table', 'ordered_dishes', 'order_id', 'completion_time', '_find_dish')
+    _menu: MenuItem | None = None
+    _id_gen = count(1)
 
     def __init__(self, table: Table) -> None:
         self.table = table
         self.ordered_dishes: list[Dish] = []
         self.order_id = self.get_id()
         self.completion_time = ''
+        self._find_dish = self.get_menu().find_dish
 
     @classmethod
     def get_id(cls) -> int:
-        id_number = cls._id_counter
-        cls._id_counter += 1
-        return id_number
+        return next(cls._id_gen)
 
     @classmethod
     def reset_id_counter(cls) -> None:
-        cls._id_counter = 1
+        cls._id_gen = count(1)
 
     @classmethod
     def get_menu(cls) -> MenuItem:
+        if cls._menu is None:
+            cls._menu = MenuItem().load_from_file()
         return cls._menu
 
     def order_dish(self, dish_name: str, status: OrderStatus = OrderStatus.TO_BE_PREPARED) -> None:
-        ordered_dish = self.get_menu().find_dish(dish_name)
-        if self.table.status == TableStatus.RESERVED:
+        ordered_dish = self._find_dish(dish_name)
+        if self.table.status is TableStatus.RESERVED:
             self.table.status = TableStatus.TAKEN
         ordered_dish.status = status
         self.ordered_dishes.append(ordered_dish)
 
     def change_dish_status(self, dish_name: str, status: OrderStatus = OrderStatus.PREPARING) -> None:
-        update_dishes = list(filter(lambda dish: dish.name == dish_name, self.ordered_dishes))[:]
-        if update_dishes:
-            for update_dish in update_dishes:
-                update_dish.status = status
-        else:
+        updated = False
+        for update_dish in filter(lambda dish: dish.name == dish_name, self.ordered_dishes):
+            update_dish.status = status
+            updated = True
+        if not updated:
             raise ValueError('Dish with that name does not exist.')
 
     def change_dish_order(self, ordered_dish: str, new_dish: str) -> None:
-        dish_to_update: Dish = self.get_menu().find_dish(ordered_dish)
-        self.ordered_dishes = [dish for dish in self.ordered_dishes if dish != dish_to_update]
+        dish_to_update: Dish = self._find_dish(ordered_dish)
+        try:
+            self.ordered_dishes.remove(dish_to_update)
+        except ValueError:
+            raise ValueError('Dish with that name does not exist.')
         self.order_dish(dish_name=new_dish)
 
     def filter_dish_status(self, status: OrderStatus) -> list[Dish]:
-        return [dish for dish in self.ordered_dishes if dish.status == status]
+        return [dish for dish in self.ordered_dishes if dish.status is status]
+
+    def has_dish_with_status(self, status: OrderStatus) -> bool:
+        return any(dish.status is status for dish in self.ordered_dishes)
 
     def add_to_history(self, file_name='order_history.csv') -> None:
         """Add to history order that is competed"""
-        if_exist = os.path.exists(file_name)
-        self.completion_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        title = 'Order ID,Table ID,Menu Item Id,Status,Price,Timestamp\n'
-        with open(file_name, 'a') as file:
-            if not if_exist:
-                file.write(title)
-            for dish in self.ordered_dishes:
-                file.write(f'{self.order_id}, {self.table.table_id}, {dish.id_number}, {dish.status.value}, '
-                           f'{dish.price:.2f} {self.completion_time}\n')
+        self.completion_time = datetime.now().isoformat(sep=' ', timespec='seconds')
+        rows = [(self.order_id, self.table.table_id, dish.id_number, dish.status.value, f'{dish.price:.2f}',
+                 self.completion_time) for dish in self.ordered_dishes]
+        with open(file_name, 'a', newline='') as file:
+            writer = csv.writer(file)
+            if file.tell() == 0:
+                writer.writerow(_HISTORY_HEADER)
+            writer.writerows(rows)
 
     def __str__(self):
-        order_dishes = '\n'.join([str(dish) for dish in self.ordered_dishes])
-        return f'Order #{self.order_id}\n{order_dishes}'
+        return '\n'.join([f'Order #{self.order_id}', *[str(dish) for dish in self.ordered_dishes]])
 
 
 class OrderManager:
@@ -357,6 +419,10 @@ class OrderManager:
     >>> order_manager.remove_order(3)
     >>> len(order_manager.orders)
     4
+    >>> order_manager.find_order(99)
+    Traceback (most recent call last):
+    ...
+    ValueError: There is no table with that id_number
     >>> print(order_manager)
     Order #1
     - Spaghetti Bolognese: ToBePrepared
@@ -372,39 +438,36 @@ class OrderManager:
 
     def __init__(self, orders: list[Order]) -> None:
         self.orders = orders or []
+        self._by_table: dict[int, Order] = {order.table.table_id: order for order in self.orders}
 
     def add_order(self, order: Order) -> None:
         if isinstance(order, Order):
             self.orders.append(order)
+            self._by_table[order.table.table_id] = order
         else:
             raise AttributeError('You can add only instance of class Order.')
 
     def remove_order(self, table_id: int) -> None:
         order = self.find_order(table_id)
-        if order:
-            order.ordered_dishes = []
-            order.table.status = TableStatus.EMPTY
+        order.ordered_dishes = []
+        order.table.status = TableStatus.EMPTY
 
     def filter_orders(self, table_status=None, order_status=None) -> list[Order]:
-        filtered_orders = self.orders
-        if table_status is not None:
-            filtered_orders = [order for order in filtered_orders if order.table.status == table_status]
-        if order_status is not None:
-            filtered_orders = [order for order in filtered_orders if order.filter_dish_status(order_status)]
-        return filtered_orders
+        return [order for order in self.orders
+                if (table_status is None or order.table.status is table_status)
+                and (order_status is None or order.has_dish_with_status(order_status))]
 
     def find_order(self, table_id: int) -> Order:
         """
         Find order by table id number.
         """
-        order_by_table = list(filter(lambda order: order.table.table_id == table_id, self.orders))[0]
-        if order_by_table:
-            return order_by_table
-        else:
+        try:
+            return self._by_table[table_id]
+        except KeyError:
             raise ValueError('There is no table with that id_number')
 
     def __str__(self) -> str:
-        return '\n'.join([str(order).strip() for order in self.orders])
+        return '\n'.join([str(order) for order in self.orders])
 
 
 class WaiterInterface(Interface):
@@ -461,7 +524,7 @@ class WaiterInterface(Interface):
     Dish: Spaghetti Bolognese was changed into Tomato Soup.
     >>> waiter_interface.paid_table(table_id=1)
     Table 1 is clear now and ready for new guests.
-    >>> waiter_interface.order_manager.find_order(1).table.status == TableStatus.EMPTY
+    >>> waiter_interface.order_manager.find_order(1).table.status is TableStatus.EMPTY
     True
     >>> try:
     ...     waiter_interface.seat_guests(guests_number=8, table_id=3)
@@ -495,18 +558,17 @@ class WaiterInterface(Interface):
     """
 
     def free_tables(self) -> str:
-        filter_orders: list[Order] = self.order_manager.filter_orders(table_status=TableStatus.EMPTY)
-        free_tables = '\n'.join([str(order.table).strip() for order in filter_orders])
+        free_tables = '\n'.join(str(order.table).strip() for order in self.order_manager.orders
+                                if order.table.status is TableStatus.EMPTY)
         return f'Free tables are:\n{free_tables}'
 
     def seat_guests(self, guests_number: int, table_id: int) -> None:
         filter_orders: list[Order] = self.order_manager.filter_orders(table_status=TableStatus.EMPTY)
-        try:
-            filter_order: Order = list(filter(lambda order: order.table.table_id == table_id, filter_orders))[0]
-            filter_order.table.add_guests(guests_number)
-            print(f'Number of guests: {guests_number}, assign to table: {table_id}, order_id: {filter_order.order_id}')
-        except IndexError:
+        filter_order: Order | None = next((order for order in filter_orders if order.table.table_id == table_id), None)
+        if filter_order is None:
             raise ValueError('There is no free table with that id_number')
+        filter_order.table.add_guests(guests_number)
+        print(f'Number of guests: {guests_number}, assign to table: {table_id}, order_id: {filter_order.order_id}')
 
     def add_order(self, order: Order) -> None:
         self.order_manager.add_order(order)
@@ -529,8 +591,9 @@ class WaiterInterface(Interface):
         order_for_update: Order = self.order_manager.find_order(table_id)
         if order_for_update.table.seats_number < new_guests_number:
             free_orders: list[Order] = self.order_manager.filter_orders(table_status=TableStatus.EMPTY)
-            new_order: Order = [order for order in free_orders if order.table.seats_number >= new_guests_number][0]
-            if new_order:
+            new_order: Order | None = next(
+                (order for order in free_orders if order.table.seats_number >= new_guests_number), None)
+            if new_order is not None:
                 new_order.table.guests = new_guests_number
                 self.change_table_status(table_id, new_status=TableStatus.EMPTY)
                 order_for_update.table.guests = 0
@@ -562,13 +625,12 @@ class WaiterInterface(Interface):
 
     def show_layout(self) -> str:
         title = ' ------------------ Tables -----------------'
-        row_tables = [f'|{str(order.table)}' for order in self.order_manager.orders]
-        row_numbers = len(row_tables) + 1
+        cells = [str(order.table) for order in self.order_manager.orders]
         columns = 4  # nie dajemy jako parametr w funkcji, bo stała
-        row_divided = [''.join(row_tables[i:i + columns]) for i in range(0, row_numbers, 4)]
+        rows = ['|' + '|'.join(cells[i:i + columns]) + '|' for i in range(0, len(cells), columns)]
 
         end = ' -------------------------------------------'
-        return f'{title}\n{'|\n'.join(row_divided)}{end}'
+        return '\n'.join([title, *rows, end])
 
 
 class KitchenInterface(Interface):
@@ -622,7 +684,7 @@ class KitchenInterface(Interface):
         Filters orders with dishes with a specified status.
         """
         filtered_orders = self.order_manager.filter_orders(order_status=status)
-        view_orders = '\n'.join([str(order).strip() for order in filtered_orders])
+        view_orders = '\n'.join([str(order) for order in filtered_orders])
         return view_orders
 
     def show_layout(self) -> str: